@@ -1,7 +1,18 @@
-from datetime import datetime
+import asyncio
+import atexit
+import time
+from datetime import datetime, timezone
+from operator import itemgetter
 from typing import Any, Dict, Literal, Optional
 
-import requests
+import httpx
+
+try:
+    import orjson  # optional speedup, installed via the "speed" extra
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+from energy_mcp_experimental.tools.logging import log_function_call
 from energy_mcp_experimental.tools.validators import (
     validate_and_parse_postcode,
     validate_datetime,
@@ -9,15 +20,99 @@ from energy_mcp_experimental.tools.validators import (
 
 BASE_URL = "https://api.carbonintensity.org.uk"
 
+# Shared async client so concurrent tool calls overlap their network waits
+# and keep-alive connections skip the TLS handshake on warm calls.
+_CLIENT = httpx.AsyncClient(
+    base_url=BASE_URL,
+    timeout=10.0,
+    limits=httpx.Limits(max_keepalive_connections=10),
+    headers={"User-Agent": "energy-mcp-experimental/0.1"},
+)
+
+
+def _close_client() -> None:
+    """Close the shared client's connection pool at interpreter shutdown."""
+    try:
+        asyncio.run(_CLIENT.aclose())
+    except RuntimeError:  # an event loop is still running or already closed
+        pass
+
+
+atexit.register(_close_client)
+
+
+# The API publishes data in 30-minute settlement periods, so responses can be
+# served from memory for a few minutes without going stale. Entries keep the
+# response ETag so expired ones can be revalidated with a cheap 304 instead of
+# re-downloading the payload.
+_CACHE_TTL_SECONDS = 300
+_CACHE_MAX_ENTRIES = 256
+_cache: Dict[str, tuple[float, str | None, Dict[str, Any]]] = {}
+_cache_lock = asyncio.Lock()
+
+
+def clear_cache() -> None:
+    """Drop every cached API response. Intended for tests."""
+    _cache.clear()
+
+
+# Row templates for the forecast formatters, hoisted so the loops below are a
+# single format call per period.
+_FORECAST_ROW_TMPL = "{i}. {from_} to {to}: {forecast}  {index}\n"
+_NATIONAL_LIST_ROW_TMPL = "{i}. {from_} to {to}: {forecast} gCO2/kWh ({index} level)\n"
+_NATIONAL_TABLE_ROW_TMPL = "| {i} | {from_} | {to} | {forecast} | {index} |\n"
+
+# Static blocks of the national table output, built once at import
+_EXPLAINER = (
+    "*Carbon intensity measures how much CO2 is emitted per unit of electricity generated (gCO2/kWh).*\n"
+    "*Lower values are better for the environment. Index ranges: very low, low, moderate, high, very high.*\n\n"
+)
+_TABLE_HEADER = (
+    "| # | From | To | Forecast (gCO2/kWh) | Intensity Level |\n"
+    "|---|------|----|--------------------|----------------|\n"
+)
+
+
+async def _make_request(endpoint: str) -> Dict[str, Any]:
+    """Make a request to the Carbon Intensity API, serving recent responses from cache."""
+    now = time.monotonic()
+
+    etag: str | None = None
+    stale_body: Dict[str, Any] | None = None
+    async with _cache_lock:
+        cached = _cache.get(endpoint)
+        if cached is not None:
+            if now - cached[0] < _CACHE_TTL_SECONDS:
+                return cached[2]
+            # Expired entry: keep it around for conditional revalidation
+            etag, stale_body = cached[1], cached[2]
+
+    headers = {"If-None-Match": etag} if etag else None
+    response = await _CLIENT.get(endpoint, headers=headers)
+
+    if response.status_code == 304 and stale_body is not None:
+        # Upstream data unchanged; refresh the TTL on the cached body
+        async with _cache_lock:
+            _cache[endpoint] = (time.monotonic(), etag, stale_body)
+        return stale_body
 
-def _make_request(endpoint: str) -> Dict[str, Any]:
-    """Make a request to the Carbon Intensity API."""
-    response = requests.get(f"{BASE_URL}{endpoint}")
     response.raise_for_status()
-    return dict(response.json())
+    if orjson is not None:
+        data = orjson.loads(response.content)
+    else:
+        data = response.json()
+
+    async with _cache_lock:
+        if len(_cache) >= _CACHE_MAX_ENTRIES:
+            # Drop the stalest entry to keep the cache bounded
+            _cache.pop(min(_cache, key=lambda k: _cache[k][0]))
+        _cache[endpoint] = (time.monotonic(), response.headers.get("ETag"), data)
 
+    return data
 
-def current_uk_grid_carbon_intensity_in_postcode(post_code: str | None = None) -> str:
+
+@log_function_call
+async def current_uk_grid_carbon_intensity_in_postcode(post_code: str | None = None) -> str:
     """Current UK Grid Carbon Intensity in Postcode - Get the current carbon intensity for your postcode.
 
 
@@ -40,7 +135,15 @@ def current_uk_grid_carbon_intensity_in_postcode(post_code: str | None = None) -
 
     try:
         endpoint = f"/regional/postcode/{outward_code}"
-        data = _make_request(endpoint)
+        # Warm the generation-mix cache in the same round-trip window; the two
+        # "current" tools are commonly requested together in one LLM session.
+        data, _generation = await asyncio.gather(
+            _make_request(endpoint),
+            _make_request("/generation"),
+            return_exceptions=True,
+        )
+        if isinstance(data, BaseException):
+            raise data
 
         if not data or "data" not in data or not data["data"]:
             return f"No carbon intensity data available for postcode {outward_code}."
@@ -56,9 +159,9 @@ def current_uk_grid_carbon_intensity_in_postcode(post_code: str | None = None) -
 
         # Add generation mix information
         result += "Generation mix:\n"
-        for fuel in intensity_data["generationmix"]:
-            if fuel["perc"] > 0:
-                result += f"- {fuel['fuel'].capitalize()}: {fuel['perc']}%\n"
+        non_zero = [f for f in intensity_data["generationmix"] if f["perc"] > 0]
+        for fuel in non_zero:
+            result += f"- {fuel['fuel'].capitalize()}: {fuel['perc']}%\n"
 
         return result
 
@@ -66,7 +169,8 @@ def current_uk_grid_carbon_intensity_in_postcode(post_code: str | None = None) -
         return f"Failed to fetch carbon intensity data: {e}"
 
 
-def carbon_intensity_history_and_forecast_for_postcode(
+@log_function_call
+async def carbon_intensity_history_and_forecast_for_postcode(
     from_datetime: str | None = None,
     forecast_hours: Literal["24", "48"] = "24",
     postcode: Optional[str] = None,
@@ -82,7 +186,7 @@ def carbon_intensity_history_and_forecast_for_postcode(
     from_dt: datetime | None = None
 
     if from_datetime is None:
-        from_dt = datetime.now()
+        from_dt = datetime.now(timezone.utc)
     else:
         from_dt = validate_datetime(from_datetime)
 
@@ -95,13 +199,15 @@ def carbon_intensity_history_and_forecast_for_postcode(
         if not outward_code:
             return f"Invalid UK postcode format: {postcode}. Please provide a valid UK postcode."
 
+    iso = from_dt.isoformat()
+
     try:
         if outward_code:
-            endpoint = f"/regional/intensity/{from_dt.isoformat()}/fw{forecast_hours}h/postcode/{outward_code}"
+            endpoint = f"/regional/intensity/{iso}/fw{forecast_hours}h/postcode/{outward_code}"
         else:
-            endpoint = f"/intensity/{from_dt.isoformat()}/fw{forecast_hours}h"
+            endpoint = f"/intensity/{iso}/fw{forecast_hours}h"
 
-        data = _make_request(endpoint)
+        data = await _make_request(endpoint)
 
         if not data:
             return "No forecast data available for the specified parameters."
@@ -109,23 +215,31 @@ def carbon_intensity_history_and_forecast_for_postcode(
         # Format the response to be LLM-friendly
         if outward_code:
             location = data["data"]["shortname"]
-            result = f"Carbon intensity forecast for {postcode} (outward code: {outward_code}, {location}) for {forecast_hours} hours from {from_dt.isoformat()}:\n\n"
+            header = f"Carbon intensity forecast for {postcode} (outward code: {outward_code}, {location}) for {forecast_hours} hours from {iso}:\n\n"
             forecast_data = data["data"]["data"]
         else:
-            result = f"**National** carbon intensity forecast for {forecast_hours} hours from {from_dt.isoformat()} in gCO2/kWh and its intensity:\n\n"
+            header = f"**National** carbon intensity forecast for {forecast_hours} hours from {iso} in gCO2/kWh and its intensity:\n\n"
             forecast_data = data["data"]
 
-        for i, period in enumerate(forecast_data):
-            intensity = period["intensity"]
-            result += f"{i + 1}. {period['from']} to {period['to']}: {intensity.get('forecast', 'N/A')}  {intensity.get('index', 'N/A')}\n"
+        rows = (
+            _FORECAST_ROW_TMPL.format(
+                i=i + 1,
+                from_=period["from"],
+                to=period["to"],
+                forecast=period["intensity"].get("forecast", "N/A"),
+                index=period["intensity"].get("index", "N/A"),
+            )
+            for i, period in enumerate(forecast_data)
+        )
 
-        return result
+        return header + "".join(rows)
 
     except Exception as e:
         return f"Failed to fetch carbon intensity forecast: {e}"
 
 
-def carbon_intensity_history_and_forecast_national(
+@log_function_call
+async def carbon_intensity_history_and_forecast_national(
     from_datetime: str | None = None,
     forecast_hours: Literal["24", "48"] = "24",
     format_type: Literal["list", "table"] = "table",
@@ -145,17 +259,19 @@ def carbon_intensity_history_and_forecast_national(
     from_dt: datetime | None = None
 
     if from_datetime is None:
-        from_dt = datetime.now()
+        from_dt = datetime.now(timezone.utc)
     else:
         from_dt = validate_datetime(from_datetime)
 
     if from_dt is None:
         return "Invalid datetime format. Please use ISO 8601 format (e.g., 2025-05-01T01:00Z)."
 
+    iso = from_dt.isoformat()
+
     try:
         # Get national carbon intensity forecast
-        endpoint = f"/intensity/{from_dt.isoformat()}/fw{forecast_hours}h"
-        data = _make_request(endpoint)
+        endpoint = f"/intensity/{iso}/fw{forecast_hours}h"
+        data = await _make_request(endpoint)
 
         if not data or "data" not in data:
             return "No forecast data available for the specified parameters."
@@ -163,44 +279,50 @@ def carbon_intensity_history_and_forecast_national(
         forecast_data = data["data"]
 
         # Format the response based on the requested format
-        if format_type == "list":
-            result = "# UK National Carbon Intensity Forecast\n\n"
-            result += f"Starting from: {from_dt.isoformat()}\n"
-            result += f"Forecast duration: {forecast_hours} hours\n\n"
+        header = (
+            "# UK National Carbon Intensity Forecast\n\n"
+            f"Starting from: {iso}\n"
+            f"Forecast duration: {forecast_hours} hours\n\n"
+        )
 
+        if format_type == "list":
             # List format (similar to previous implementation)
-            for i, period in enumerate(forecast_data):
-                intensity = period["intensity"]
-                result += f"{i + 1}. {period['from']} to {period['to']}: {intensity.get('forecast', 'N/A')} gCO2/kWh ({intensity.get('index', 'N/A')} level)\n"
-
-        else:  # Table format (better for analysis and parsing)
-            result = "# UK National Carbon Intensity Forecast\n\n"
-            result += f"Starting from: {from_dt.isoformat()}\n"
-            result += f"Forecast duration: {forecast_hours} hours\n\n"
-
-            # Add brief explanation for LLM understanding
-            result += "*Carbon intensity measures how much CO2 is emitted per unit of electricity generated (gCO2/kWh).*\n"
-            result += "*Lower values are better for the environment. Index ranges: very low, low, moderate, high, very high.*\n\n"
-
-            # Table format
-            result += "| # | From | To | Forecast (gCO2/kWh) | Intensity Level |\n"
-            result += "|---|------|----|--------------------|----------------|\n"
-
-            for i, period in enumerate(forecast_data):
-                intensity = period["intensity"]
-                forecast_value = intensity.get("forecast", "N/A")
-                intensity_level = intensity.get("index", "N/A")
-
-                # Add row to table
-                result += f"| {i + 1} | {period['from']} | {period['to']} | {forecast_value} | {intensity_level} |\n"
-
-        return result
+            rows = (
+                _NATIONAL_LIST_ROW_TMPL.format(
+                    i=i + 1,
+                    from_=period["from"],
+                    to=period["to"],
+                    forecast=period["intensity"].get("forecast", "N/A"),
+                    index=period["intensity"].get("index", "N/A"),
+                )
+                for i, period in enumerate(forecast_data)
+            )
+
+            return header + "".join(rows)
+
+        # Table format (better for analysis and parsing), with a brief
+        # explanation for LLM understanding
+        header += _EXPLAINER + _TABLE_HEADER
+
+        rows = (
+            _NATIONAL_TABLE_ROW_TMPL.format(
+                i=i + 1,
+                from_=period["from"],
+                to=period["to"],
+                forecast=period["intensity"].get("forecast", "N/A"),
+                index=period["intensity"].get("index", "N/A"),
+            )
+            for i, period in enumerate(forecast_data)
+        )
+
+        return header + "".join(rows)
 
     except Exception as e:
         return f"Failed to fetch carbon intensity forecast: {e}"
 
 
-def current_national_generation_mix() -> str:
+@log_function_call
+async def current_national_generation_mix() -> str:
     """Current UK National Generation Mix - Get the current national electricity generation mix.
 
     This function retrieves the current national electricity generation mix from the Carbon Intensity API.
@@ -209,7 +331,7 @@ def current_national_generation_mix() -> str:
     """
     try:
         endpoint = "/generation"
-        data = _make_request(endpoint)
+        data = await _make_request(endpoint)
 
         if not data or "data" not in data or not data["data"]:
             return "No generation mix data available."
@@ -219,16 +341,16 @@ def current_national_generation_mix() -> str:
         to_time = data["data"]["to"]
 
         # Format the response to be LLM-friendly
-        result = f"UK National Generation Mix ({from_time} to {to_time}):\n\n"
+        parts = [f"UK National Generation Mix ({from_time} to {to_time}):\n\n"]
 
-        # Sort by percentage (descending)
-        mix_data.sort(key=lambda x: x["perc"], reverse=True)
+        # Drop zero-percent fuels first so the sort only touches what we show
+        non_zero = [f for f in mix_data if f["perc"] > 0]
+        non_zero.sort(key=itemgetter("perc"), reverse=True)
 
-        for fuel in mix_data:
-            if fuel["perc"] > 0:
-                result += f"- {fuel['fuel'].capitalize()}: {fuel['perc']}%\n"
+        for fuel in non_zero:
+            parts.append(f"- {fuel['fuel'].capitalize()}: {fuel['perc']}%\n")
 
-        return result
+        return "".join(parts)
 
     except Exception as e:
         return f"Failed to fetch generation mix data: {e}"
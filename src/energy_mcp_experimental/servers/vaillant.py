@@ -1,15 +1,29 @@
+import functools
+import json
 import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Literal
 
+from energy_mcp_experimental.tools.logging import log_function_call
 from energy_mcp_experimental.tools.validators import validate_and_parse_date
 
-try:
-    from vaillant_client.api import VaillantApi, VaillantApiConfig
-    _vaillant_import_error = None
-except ImportError as exc:  # pragma: no cover - optional dependency
-    VaillantApi = VaillantApiConfig = None  # type: ignore[assignment]
-    _vaillant_import_error = exc
+
+
+_MISSING = object()
+
+
+class _UncachedResult(str):
+    """Marks a tool result (e.g. an error message) that must not be cached.
+
+    Tools surface failures to the LLM as plain strings, and replaying a
+    transient failure from cache would block retries for the rest of the
+    freshness bucket, so error paths wrap their message in this type and the
+    memoizing wrapper passes it through without storing it.
+    """
 
 
 _VAILLANT_DEPENDENCY_MESSAGE = (
@@ -17,7 +31,244 @@ _VAILLANT_DEPENDENCY_MESSAGE = (
     "Install it from https://github.com/cdinu/vaillant-client and retry."
 )
 
+# The Vaillant cloud data changes slowly, so formatted tool output can be
+# reused for a while before re-fetching.
+_RESULT_CACHE_TTL_SECONDS = 900
+
+# Formatted results are also persisted to disk so a restarted server does not
+# re-hit the Vaillant cloud for data it rendered minutes ago.
+_DISK_CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+    "energy-mcp",
+    "vaillant.json",
+)
+_disk_cache: dict[str, str] | None = None
+
+# The batch tool fans memoized calls out over a thread pool, so every
+# mutation of the in-memory and disk caches happens under this lock.
+_memo_lock = threading.Lock()
+
+# vaillant-client makes no thread-safety promises and _get_api shares one
+# instance per serial, so API calls are serialized through this lock.
+_api_lock = threading.Lock()
+
+
+def _get_disk_cache() -> dict[str, str]:
+    global _disk_cache
+    if _disk_cache is None:
+        try:
+            with open(_DISK_CACHE_PATH, encoding="utf-8") as fh:
+                _disk_cache = json.load(fh)
+        except (OSError, ValueError):
+            _disk_cache = {}
+    return _disk_cache
+
+
+def _save_disk_cache(entries: dict[str, str]) -> None:
+    # Best effort; caching must never break the tools
+    try:
+        os.makedirs(os.path.dirname(_DISK_CACHE_PATH), exist_ok=True)
+        tmp_path = _DISK_CACHE_PATH + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(entries, fh)
+        os.replace(tmp_path, _DISK_CACHE_PATH)
+    except OSError:
+        pass
+
+
+def _memoize_result(func):
+    """Cache a tool's formatted output, keyed on its arguments, the configured
+    serial and a freshness bucket, so an LLM asking the same question twice in
+    a session skips the Vaillant round-trip."""
+    cache: dict[tuple, str] = {}
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        bucket = int(time.time() // _RESULT_CACHE_TTL_SECONDS)
+        key = (
+            bucket,
+            os.getenv("VAILLANT_SERIAL"),
+            args,
+            tuple(sorted(kwargs.items())),
+        )
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable argument; skip caching
+            return func(*args, **kwargs)
+
+        # Cold start: the previous process may have persisted this result
+        disk_key = f"{bucket}:{func.__name__}:{key[1:]!r}"
+        with _memo_lock:
+            cached = _get_disk_cache().get(disk_key)
+        if cached is not None:
+            cache[key] = cached
+            return cached
+
+        result = func(*args, **kwargs)
+
+        if isinstance(result, _UncachedResult):
+            return str(result)
+
+        with _memo_lock:
+            # Evict entries from earlier buckets so both caches stay small
+            for stale in [k for k in cache if k[0] != bucket]:
+                del cache[stale]
+            cache[key] = result
+
+            disk = _get_disk_cache()
+            prefix = f"{bucket}:"
+            for stale_key in [k for k in disk if not k.startswith(prefix)]:
+                del disk[stale_key]
+            disk[disk_key] = result
+            _save_disk_cache(disk)
+
+        return result
+
+    return wrapper
+
+
+# Splits camelCase keys ahead of each capital letter, e.g. "flowTemperature"
+# -> "flow Temperature"
+_CAMEL_RE = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+def _humanize(key: str) -> str:
+    """Turn a camelCase field name into a readable label."""
+    return _CAMEL_RE.sub(" ", key).capitalize()
+
+
+@functools.lru_cache(maxsize=256)
+def _fmt_ts(epoch: int) -> str:
+    """Format an epoch "until" timestamp for display. Cached because override
+    and boost timestamps are frequently shared between sibling settings."""
+    return str(datetime.fromtimestamp(epoch))
+
+
+@functools.lru_cache(maxsize=16)
+def _mask_serial(serial: str) -> str:
+    """Mask a device serial number for privacy, keeping only the tail."""
+    return "V" + serial[24:] if len(serial) > 24 else serial
 
+
+@functools.lru_cache(maxsize=1)
+def _get_serial() -> str:
+    """Read the configured serial once; the environment is fixed at launch."""
+    return os.getenv("VAILLANT_SERIAL", "UNKNOWN")
+
+
+@functools.cache
+def _load_vaillant():
+    """Import the optional vaillant-client lazily on the first tool call.
+
+    Importing the package (and its transitive HTTP stack) costs noticeable
+    startup time, and none of the carbon-intensity tools need it, so the
+    import is deferred until a Vaillant tool is actually invoked. Returns the
+    (VaillantApi, VaillantApiConfig) pair, or the import error if the
+    dependency is missing.
+    """
+    try:
+        from vaillant_client.api import VaillantApi, VaillantApiConfig
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        return exc
+    return VaillantApi, VaillantApiConfig
+
+
+def _require_vaillant(func):
+    """Short-circuit the dependency and serial checks shared by every tool."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        loaded = _load_vaillant()
+        if isinstance(loaded, ImportError):
+            return _VAILLANT_DEPENDENCY_MESSAGE + f" (import error: {loaded})"
+
+        if _get_serial() == "UNKNOWN":
+            return "Vaillant heat pump serial number not found."
+
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+@functools.lru_cache(maxsize=4)
+def _get_api(serial: str):
+    """Reuse one client per serial so its HTTP connection pool, OAuth token and
+    any internal caches survive across tool calls."""
+    api_cls, config_cls = _load_vaillant()
+    return api_cls(config_cls(), [serial])
+
+
+def _period_energy_wh(period) -> tuple[int, int, int, int, int, int]:
+    """Extract the six raw Wh readings of a consumption period in one pass."""
+    ch = period.centralHeating
+    dhw = period.domesticHotWater
+    if dhw is not None:
+        return (
+            ch.electricity or 0,
+            ch.environmentalYield or 0,
+            ch.generated or 0,
+            dhw.electricity or 0,
+            dhw.environmentalYield or 0,
+            dhw.generated or 0,
+        )
+    return (ch.electricity or 0, ch.environmentalYield or 0, ch.generated or 0, 0, 0, 0)
+
+
+# Row template for the consumption table, compiled once at import so the
+# per-period loop is a single .format() call.
+_ROW_FMT = (
+    "| {period} | {ch_elec} | {ch_env} | {ch_gen} | {ch_cop} "
+    "| {dhw_elec} | {dhw_env} | {dhw_gen} | {dhw_cop} "
+    "| {period_elec} | {period_heat} | {period_cop} |\n"
+)
+
+
+def _format_consumption_row(
+    period_str: str, energy_wh: tuple[int, int, int, int, int, int]
+) -> str:
+    """Render one markdown row of the consumption table from raw Wh readings."""
+    ch_elec_wh, ch_env_wh, ch_gen_wh, dhw_elec_wh, dhw_env_wh, dhw_gen_wh = energy_wh
+
+    # Central Heating - convert from Wh to kWh with 1 decimal place
+    ch_elec = round(ch_elec_wh / 1000, 1)
+    ch_env = round(ch_env_wh / 1000, 1)
+    ch_gen = round(ch_gen_wh / 1000, 1)
+    ch_cop = round(ch_gen_wh / ch_elec_wh, 1) if ch_elec_wh > 0 else 0
+
+    # Domestic Hot Water - convert from Wh to kWh with 1 decimal place
+    dhw_elec = round(dhw_elec_wh / 1000, 1)
+    dhw_env = round(dhw_env_wh / 1000, 1)
+    dhw_gen = round(dhw_gen_wh / 1000, 1)
+    dhw_cop = round(dhw_gen_wh / dhw_elec_wh, 1) if dhw_elec_wh > 0 else 0
+
+    # Totals for this period - convert from Wh to kWh for display
+    period_elec_wh = ch_elec_wh + dhw_elec_wh
+    period_heat_wh = ch_gen_wh + dhw_gen_wh
+    period_elec = round(period_elec_wh / 1000, 1)
+    period_heat = round(period_heat_wh / 1000, 1)
+    period_cop = round(period_heat_wh / period_elec_wh, 1) if period_elec_wh > 0 else 0
+
+    return _ROW_FMT.format(
+        period=period_str,
+        ch_elec=ch_elec,
+        ch_env=ch_env,
+        ch_gen=ch_gen,
+        ch_cop=ch_cop,
+        dhw_elec=dhw_elec,
+        dhw_env=dhw_env,
+        dhw_gen=dhw_gen,
+        dhw_cop=dhw_cop,
+        period_elec=period_elec,
+        period_heat=period_heat,
+        period_cop=period_cop,
+    )
+
+
+@log_function_call
+@_require_vaillant
+@_memoize_result
 def vaillant_energy_consumption(
     from_datetime_yyyy_mm_dd: str,
     to_datetime_yyyy_mm_dd: str,
@@ -33,159 +284,227 @@ def vaillant_energy_consumption(
         to_datetime_yyyy_mm_dd: End date in YYYY-MM-DD format
         scale: Data granularity - hourly, daily, or monthly
     """
-    if VaillantApi is None or _vaillant_import_error is not None:
-        return _VAILLANT_DEPENDENCY_MESSAGE + (
-            f" (import error: {_vaillant_import_error})"
-            if _vaillant_import_error
-            else ""
-        )
-
-    serial = os.getenv("VAILLANT_SERIAL", "UNKNOWN")
-
-    if serial == "UNKNOWN":
-        return "Vaillant heat pump serial number not found."
+    serial = _get_serial()
 
     from_datetime = validate_and_parse_date(from_datetime_yyyy_mm_dd)
     to_datetime = validate_and_parse_date(to_datetime_yyyy_mm_dd)
     if from_datetime is None or to_datetime is None:
-        return "Invalid date format. Please use YYYY-MM-DD or a valid format."
+        return _UncachedResult(
+            "Invalid date format. Please use YYYY-MM-DD or a valid format."
+        )
 
     # use vaillant client to retrieve energy consumption
-    config = VaillantApiConfig()
-    api = VaillantApi(config, [serial])
+    api = _get_api(serial)
 
     try:
-        consumption = api.get_components_consumption(
-            serial, scale, from_datetime, to_datetime
-        )
+        with _api_lock:
+            consumption = api.get_components_consumption(
+                serial, scale, from_datetime, to_datetime
+            )
 
         if consumption is None:
-            return "No energy consumption data available."
+            return _UncachedResult("No energy consumption data available.")
 
-        if not consumption:
+        if len(consumption) == 0:
             return f"No consumption data found for the period {from_datetime} to {to_datetime}."
 
         # Format the response to be LLM-friendly
         system = consumption[0]  # Take the first system if multiple are returned
 
-        # Mask the serial number for privacy
-        serial_short = "V" + system.systemComponentSerialNumber[24:]
-        system.systemComponentSerialNumber = serial_short
-
-        # Convert timestamps to datetime objects
-        for c in system.consumptions:
-            c.from_ = datetime.fromtimestamp(c.from_)
-            c.to = datetime.fromtimestamp(c.to)
+        # Mask the serial number for privacy (local only: the model instance
+        # may be shared through the result cache, so never mutate it)
+        serial_short = _mask_serial(system.systemComponentSerialNumber)
 
         # Convert total consumption from Wh to kWh with 1 decimal place
         total_consumption_kwh = round(system.totalConsumption / 1000, 1)
 
-        result = "# Vaillant Heat Pump Energy Consumption\n\n"
+        parts: list[str] = ["# Vaillant Heat Pump Energy Consumption\n\n"]
 
-        result += f"Device: {serial_short} ({system.deviceType})\n"
-        result += f"Period: {from_datetime} to {to_datetime}\n"
-        result += f"Data granularity: {scale}\n"
-        result += f"Total consumption: {total_consumption_kwh} kWh\n\n"
+        parts.append(f"Device: {serial_short} ({system.deviceType})\n")
+        parts.append(f"Period: {from_datetime} to {to_datetime}\n")
+        parts.append(f"Data granularity: {scale}\n")
+        parts.append(f"Total consumption: {total_consumption_kwh} kWh\n\n")
 
         # Get consumption by time period in table format - better for parsing and graphing
-        result += "## Detailed Consumption by Period\n\n"
-
-        # Calculate totals
-        total_electricity = 0
-        total_env_yield = 0
-        total_generated = 0
+        parts.append("## Detailed Consumption by Period\n\n")
 
         # Define table headers
-        result += "| Period | CH Elec (kWh) | CH Env (kWh) | CH Heat (kWh) | CH COP | DHW Elec (kWh) | DHW Env (kWh) | DHW Heat (kWh) | DHW COP | Total Elec (kWh) | Total Heat (kWh) | Overall COP |\n"
-        result += "|--------|--------------|--------------|---------------|--------|----------------|---------------|----------------|---------|-----------------|-----------------|------------|\n"
+        parts.append(
+            "| Period | CH Elec (kWh) | CH Env (kWh) | CH Heat (kWh) | CH COP | DHW Elec (kWh) | DHW Env (kWh) | DHW Heat (kWh) | DHW COP | Total Elec (kWh) | Total Heat (kWh) | Overall COP |\n"
+        )
+        parts.append(
+            "|--------|--------------|--------------|---------------|--------|----------------|---------------|----------------|---------|-----------------|-----------------|------------|\n"
+        )
 
         # Use all periods, up to 336 entries (enough for 2 weeks of hourly data)
         max_periods = min(336, len(system.consumptions))
         display_periods = system.consumptions[:max_periods]
 
-        for period in display_periods:
-            period_start = period.from_
-            # period_end = period.to
-            period_str = f"{period_start.strftime('%Y-%m-%d %H:%M')}"
-
-            # Central Heating - convert from Wh to kWh with 1 decimal place
-            ch_elec_wh = period.centralHeating.electricity or 0
-            ch_env_wh = period.centralHeating.environmentalYield or 0
-            ch_gen_wh = period.centralHeating.generated or 0
-
-            ch_elec = round(ch_elec_wh / 1000, 1)
-            ch_env = round(ch_env_wh / 1000, 1)
-            ch_gen = round(ch_gen_wh / 1000, 1)
-            ch_cop = round(ch_gen_wh / ch_elec_wh, 1) if ch_elec_wh > 0 else 0
-
-            # Domestic Hot Water - convert from Wh to kWh with 1 decimal place
-            dhw_elec_wh = 0
-            dhw_env_wh = 0
-            dhw_gen_wh = 0
-
-            if period.domesticHotWater:
-                dhw_elec_wh = period.domesticHotWater.electricity or 0
-                dhw_env_wh = period.domesticHotWater.environmentalYield or 0
-                dhw_gen_wh = period.domesticHotWater.generated or 0
-
-            dhw_elec = round(dhw_elec_wh / 1000, 1)
-            dhw_env = round(dhw_env_wh / 1000, 1)
-            dhw_gen = round(dhw_gen_wh / 1000, 1)
-            dhw_cop = round(dhw_gen_wh / dhw_elec_wh, 1) if dhw_elec_wh > 0 else 0
-
-            # Totals for this period in Wh (for running totals)
-            period_elec_wh = ch_elec_wh + dhw_elec_wh
-            period_heat_wh = ch_gen_wh + dhw_gen_wh
-
-            # Totals for this period in kWh (for display)
-            period_elec = round(period_elec_wh / 1000, 1)
-            period_heat = round(period_heat_wh / 1000, 1)
-            period_cop = (
-                round(period_heat_wh / period_elec_wh, 1) if period_elec_wh > 0 else 0
+        # Precompute the period label column in one pass, only for the
+        # periods we actually render - the API may return far more
+        period_strs = [
+            datetime.fromtimestamp(c.from_).strftime("%Y-%m-%d %H:%M")
+            for c in display_periods
+        ]
+
+        # Pull the raw Wh readings into one columnar pass so totals and the
+        # row loop below avoid repeated attribute traversal per period
+        energy_wh = [_period_energy_wh(p) for p in display_periods]
+
+        total_electricity = sum(e[0] + e[3] for e in energy_wh)
+        total_env_yield = sum(e[1] + e[4] for e in energy_wh)
+        total_generated = sum(e[2] + e[5] for e in energy_wh)
+
+        # Emit the whole table body as one joined string
+        parts.append(
+            "".join(
+                _format_consumption_row(period_str, wh)
+                for period_str, wh in zip(period_strs, energy_wh)
             )
-
-            # Add to running totals (in Wh)
-            total_electricity += period_elec_wh
-            total_env_yield += ch_env_wh + dhw_env_wh
-            total_generated += period_heat_wh
-
-            # Add table row
-            result += f"| {period_str} | {ch_elec} | {ch_env} | {ch_gen} | {ch_cop} | {dhw_elec} | {dhw_env} | {dhw_gen} | {dhw_cop} | {period_elec} | {period_heat} | {period_cop} |\n"
+        )
 
         # If there are more periods than we displayed
         if len(system.consumptions) > max_periods:
-            result += f"\n*Note: Showing {max_periods} of {len(system.consumptions)} periods.*\n\n"
+            parts.append(
+                f"\n*Note: Showing {max_periods} of {len(system.consumptions)} periods.*\n\n"
+            )
 
         # Summary - convert totals from Wh to kWh with 1 decimal place
         total_electricity_kwh = round(total_electricity / 1000, 1)
         total_env_yield_kwh = round(total_env_yield / 1000, 1)
         total_generated_kwh = round(total_generated / 1000, 1)
 
-        result += "## Summary\n\n"
-        result += f"Total electricity consumed: {total_electricity_kwh} kWh\n"
-        result += f"Total environmental yield: {total_env_yield_kwh} kWh\n"
-        result += f"Total heat generated: {total_generated_kwh} kWh\n"
+        parts.append("## Summary\n\n")
+        parts.append(f"Total electricity consumed: {total_electricity_kwh} kWh\n")
+        parts.append(f"Total environmental yield: {total_env_yield_kwh} kWh\n")
+        parts.append(f"Total heat generated: {total_generated_kwh} kWh\n")
 
         # Add explanation of the columns for LLM understanding
-        result += "\n**Column Definitions:**\n"
-        result += "- **CH**: Central Heating\n"
-        result += "- **DHW**: Domestic Hot Water\n"
-        result += "- **Elec**: Electricity Consumption kWh\n"
-        result += "- **Env**: Environmental Yield  kWh\n"
-        result += "- **Heat**: Heating Total kWh\n"
-
-        result += "*Heat pumps extract energy from the environment (air/ground) and use electricity to convert it to usable heat. The Coefficient of Performance (COP) measures efficiency - a COP of 3.5 means 3.5 units of heat produced for every 1 unit of electricity used.*\n\n"
+        parts.append("\n**Column Definitions:**\n")
+        parts.append("- **CH**: Central Heating\n")
+        parts.append("- **DHW**: Domestic Hot Water\n")
+        parts.append("- **Elec**: Electricity Consumption kWh\n")
+        parts.append("- **Env**: Environmental Yield  kWh\n")
+        parts.append("- **Heat**: Heating Total kWh\n")
+
+        parts.append(
+            "*Heat pumps extract energy from the environment (air/ground) and use electricity to convert it to usable heat. The Coefficient of Performance (COP) measures efficiency - a COP of 3.5 means 3.5 units of heat produced for every 1 unit of electricity used.*\n\n"
+        )
 
         if total_electricity > 0:
             overall_cop = round(total_generated / total_electricity, 1)
-            result += f"Overall COP: {overall_cop}\n"
+            parts.append(f"Overall COP: {overall_cop}\n")
 
-        return result
+        return "".join(parts)
 
     except Exception as e:
-        return f"Failed to fetch energy consumption: {e}"
+        return _UncachedResult(f"Failed to fetch energy consumption: {e}")
+
+
+# Field tables driving the advanced-diagnostics report. Each entry is
+# (attribute, label, unit); a None unit means the device reports its own
+# units via the companion fanUnits attribute.
+_DIAG_STATUS_FIELDS = [
+    ("compressorActive", "Compressor", "Active", "Inactive"),
+    ("heatingPumpActive", "Heating pump", "Active", "Inactive"),
+    ("blocked", "System blocked", "Yes", "No"),
+    ("frostProtectionActive", "Frost protection", "Active", "Inactive"),
+    ("sanitaryOrLoadingPumpActive", "Sanitary/loading pump", "Active", "Inactive"),
+    ("solarPumpActive", "Solar pump", "Active", "Inactive"),
+]
+
+_DIAG_TEMP_FIELDS = [
+    ("outdoorTemperature", "Outdoor temperature", "°C"),
+    ("flowTemperature", "Flow temperature", "°C"),
+    ("returnTemperature", "Return temperature", "°C"),
+    ("airInletTemperature", "Air inlet temperature", "°C"),
+    ("evaporationTemperature", "Evaporation temperature", "°C"),
+    ("condensationTemperature", "Condensation temperature", "°C"),
+    ("heatExchangerInletTemperature", "Heat exchanger inlet temperature", "°C"),
+    ("heatExchangerOutletTemperature", "Heat exchanger outlet temperature", "°C"),
+    ("inletTemperature", "Inlet temperature", "°C"),
+    ("outletTemperature", "Outlet temperature", "°C"),
+    ("roomTemperature", "Room temperature", "°C"),
+    ("roomTemperatureTarget", "Room temperature target", "°C"),
+]
+
+_DIAG_METRIC_FIELDS = [
+    ("operatingHours", "Operating hours", " hours"),
+    ("compressorStarts", "Compressor starts", ""),
+    ("safetyRelayCommutations", "Safety relay commutations", ""),
+    ("safetyRelayOperatingHours", "Safety relay operating hours", " hours"),
+]
+
+_DIAG_COMPONENT_FIELDS = [
+    ("electronicExpansionValvePosition", "Electronic expansion valve position", "%"),
+    ("fanSpeed", "Fan speed", None),
+    ("frequencySignal", "Frequency signal", " Hz"),
+    ("waterPressure", "Water pressure", " bar"),
+    ("highPressureSensor", "High pressure sensor", " bar"),
+    ("desiredFlowTemperature", "Desired flow temperature", "°C"),
+    ("heatingDemand", "Heating demand", "%"),
+]
+
+_DIAG_REFRIG_FIELDS = [
+    ("currentSubcooling", "Current subcooling", "K"),
+    ("setpointSubcooling", "Setpoint subcooling", "K"),
+    ("currentSuperheating", "Current superheating", "K"),
+    ("targetSuperheating", "Target superheating", "K"),
+    ("condenserDeltaTemperature", "Condenser delta temperature", "K"),
+]
+
+
+def _diag_value_lines(diag, fields) -> str:
+    """Render "- label: value unit" lines for every present, non-None field."""
+    lines = []
+    for attr, label, unit in fields:
+        value = getattr(diag, attr, None)
+        if value is None:
+            continue
+        if unit is None:  # fan speed reports its own units
+            unit = f" {getattr(diag, 'fanUnits', 'rpm')}"
+        lines.append(f"- {label}: {value}{unit}\n")
+    return "".join(lines)
+
+
+@log_function_call
+@_require_vaillant
+def vaillant_energy_consumption_batch(
+    from_datetime_yyyy_mm_dd: str,
+    to_datetime_yyyy_mm_dd: str,
+    scales: list[Literal["hourly", "daily", "monthly"]] | None = None,
+) -> str:
+    """Vaillant Heatpump Energy Consumption Batch - from_datetime format is YYYY-MM-DD, to_datetime format YYYY-MM-DD, scales is a list drawn from hourly, daily, monthly
 
+    Get the energy consumption of the Vaillant heat pump/boiler at several granularities
+    in one MCP tool call instead of three, with cached scales served without
+    re-fetching. API access is serialized internally, so uncached scales are
+    still fetched one at a time.
 
+    Args:
+        from_datetime_yyyy_mm_dd: Start date in YYYY-MM-DD format
+        to_datetime_yyyy_mm_dd: End date in YYYY-MM-DD format
+        scales: Data granularities to fetch; defaults to all three
+    """
+    if not scales:
+        scales = ["hourly", "daily", "monthly"]
+
+    with ThreadPoolExecutor(max_workers=len(scales)) as executor:
+        reports = list(
+            executor.map(
+                lambda scale: vaillant_energy_consumption(
+                    from_datetime_yyyy_mm_dd, to_datetime_yyyy_mm_dd, scale
+                ),
+                scales,
+            )
+        )
+
+    return "\n\n---\n\n".join(reports)
+
+
+@log_function_call
+@_require_vaillant
+@_memoize_result
 def vaillant_advanced_diagnostics() -> str:
     """Vaillant Heatpump Advanced Diagnosis - Get the advanced diagnostics of the Vaillant heat pump, boiler, or control system.
 
@@ -194,193 +513,78 @@ def vaillant_advanced_diagnostics() -> str:
 
     The data includes system status, temperatures, operational hours, efficiency metrics, and component states.
     """
-    if VaillantApi is None or _vaillant_import_error is not None:
-        return _VAILLANT_DEPENDENCY_MESSAGE + (
-            f" (import error: {_vaillant_import_error})"
-            if _vaillant_import_error
-            else ""
-        )
-
-    serial = os.getenv("VAILLANT_SERIAL", "UNKNOWN")
-
-    if serial == "UNKNOWN":
-        return "Vaillant heat pump serial number not found."
+    serial = _get_serial()
 
     # use vaillant client to retrieve advanced diagnostics
-    config = VaillantApiConfig()
-    api = VaillantApi(config, [serial])
+    api = _get_api(serial)
 
     try:
-        diagnostics = api.get_advanced_diagnostics(serial, include_metadata=True)
+        with _api_lock:
+            diagnostics = api.get_advanced_diagnostics(serial, include_metadata=True)
 
         if diagnostics is None:
-            return "No diagnostics data available."
+            return _UncachedResult("No diagnostics data available.")
 
         # Format the response to be LLM-friendly
         result = "# Vaillant Heat Pump Advanced Diagnostics\n\n"
 
         # Process each device/component in the diagnostic data
         for diag in diagnostics.root:
-            # Mask the serial number for privacy
+            # Mask the serial number for privacy (read-only; cached models
+            # must not be mutated)
             if diag.serialNumber is not None:
-                diag.serialNumber = "V" + diag.serialNumber[24:]
-                result += f"## Device: {diag.serialNumber}\n"
+                masked_serial = _mask_serial(diag.serialNumber)
+                result += f"## Device: {masked_serial}\n"
 
             # System status
             result += "## System Status\n\n"
 
-            # Add active/inactive status
-            if hasattr(diag, "compressorActive"):
-                result += f"- Compressor: {'Active' if diag.compressorActive else 'Inactive'}\n"
-            if hasattr(diag, "heatingPumpActive"):
-                result += f"- Heating pump: {'Active' if diag.heatingPumpActive else 'Inactive'}\n"
-            if hasattr(diag, "blocked"):
-                result += f"- System blocked: {'Yes' if diag.blocked else 'No'}\n"
-            if hasattr(diag, "frostProtectionActive"):
-                result += f"- Frost protection: {'Active' if diag.frostProtectionActive else 'Inactive'}\n"
-            if hasattr(diag, "sanitaryOrLoadingPumpActive"):
-                result += f"- Sanitary/loading pump: {'Active' if diag.sanitaryOrLoadingPumpActive else 'Inactive'}\n"
-            if hasattr(diag, "solarPumpActive"):
-                result += f"- Solar pump: {'Active' if diag.solarPumpActive else 'Inactive'}\n"
+            for attr, label, true_text, false_text in _DIAG_STATUS_FIELDS:
+                value = getattr(diag, attr, _MISSING)
+                if value is not _MISSING:
+                    result += f"- {label}: {true_text if value else false_text}\n"
 
             # Temperature readings
             result += "\n## Temperature Readings\n\n"
+            result += _diag_value_lines(diag, _DIAG_TEMP_FIELDS)
 
-            temp_fields = [
-                ("outdoorTemperature", "Outdoor temperature"),
-                ("flowTemperature", "Flow temperature"),
-                ("returnTemperature", "Return temperature"),
-                ("airInletTemperature", "Air inlet temperature"),
-                ("evaporationTemperature", "Evaporation temperature"),
-                ("condensationTemperature", "Condensation temperature"),
-                ("heatExchangerInletTemperature", "Heat exchanger inlet temperature"),
-                ("heatExchangerOutletTemperature", "Heat exchanger outlet temperature"),
-                ("inletTemperature", "Inlet temperature"),
-                ("outletTemperature", "Outlet temperature"),
-                ("roomTemperature", "Room temperature"),
-                ("roomTemperatureTarget", "Room temperature target"),
-            ]
-
-            for field, label in temp_fields:
-                if hasattr(diag, field) and getattr(diag, field) is not None:
-                    value = getattr(diag, field)
-                    result += f"- {label}: {value}°C\n"
-
-            # Performance metrics
+            # Performance metrics: operational hours and counters
             result += "\n## Performance Metrics\n\n"
+            result += _diag_value_lines(diag, _DIAG_METRIC_FIELDS)
 
-            # Operational hours and counters
-            if hasattr(diag, "operatingHours") and diag.operatingHours is not None:
-                result += f"- Operating hours: {diag.operatingHours} hours\n"
-            if hasattr(diag, "compressorStarts") and diag.compressorStarts is not None:
-                result += f"- Compressor starts: {diag.compressorStarts}\n"
-            if (
-                hasattr(diag, "safetyRelayCommutations")
-                and diag.safetyRelayCommutations is not None
-            ):
-                result += (
-                    f"- Safety relay commutations: {diag.safetyRelayCommutations}\n"
-                )
-            if (
-                hasattr(diag, "safetyRelayOperatingHours")
-                and diag.safetyRelayOperatingHours is not None
-            ):
-                result += f"- Safety relay operating hours: {diag.safetyRelayOperatingHours} hours\n"
-
-            # Component settings
+            # Component settings: valves, pumps and heating data
             result += "\n## Component Settings\n\n"
-
-            # Valves and component positions
-            if (
-                hasattr(diag, "electronicExpansionValvePosition")
-                and diag.electronicExpansionValvePosition is not None
-            ):
-                result += f"- Electronic expansion valve position: {diag.electronicExpansionValvePosition}%\n"
-            if hasattr(diag, "fanSpeed") and diag.fanSpeed is not None:
-                fan_units = getattr(diag, "fanUnits", "rpm")
-                result += f"- Fan speed: {diag.fanSpeed} {fan_units}\n"
-            if hasattr(diag, "frequencySignal") and diag.frequencySignal is not None:
-                result += f"- Frequency signal: {diag.frequencySignal} Hz\n"
-            if hasattr(diag, "waterPressure") and diag.waterPressure is not None:
-                result += f"- Water pressure: {diag.waterPressure} bar\n"
-            if (
-                hasattr(diag, "highPressureSensor")
-                and diag.highPressureSensor is not None
-            ):
-                result += f"- High pressure sensor: {diag.highPressureSensor} bar\n"
-
-            # Heating data
-            if (
-                hasattr(diag, "desiredFlowTemperature")
-                and diag.desiredFlowTemperature is not None
-            ):
-                result += (
-                    f"- Desired flow temperature: {diag.desiredFlowTemperature}°C\n"
-                )
-            if hasattr(diag, "heatingDemand") and diag.heatingDemand is not None:
-                result += f"- Heating demand: {diag.heatingDemand}%\n"
+            result += _diag_value_lines(diag, _DIAG_COMPONENT_FIELDS)
 
             # Refrigerant circuit details
             result += "\n## Refrigerant Circuit\n\n"
-
-            if (
-                hasattr(diag, "currentSubcooling")
-                and diag.currentSubcooling is not None
-            ):
-                result += f"- Current subcooling: {diag.currentSubcooling}K\n"
-            if (
-                hasattr(diag, "setpointSubcooling")
-                and diag.setpointSubcooling is not None
-            ):
-                result += f"- Setpoint subcooling: {diag.setpointSubcooling}K\n"
-            if (
-                hasattr(diag, "currentSuperheating")
-                and diag.currentSuperheating is not None
-            ):
-                result += f"- Current superheating: {diag.currentSuperheating}K\n"
-            if (
-                hasattr(diag, "targetSuperheating")
-                and diag.targetSuperheating is not None
-            ):
-                result += f"- Target superheating: {diag.targetSuperheating}K\n"
-            if (
-                hasattr(diag, "condenserDeltaTemperature")
-                and diag.condenserDeltaTemperature is not None
-            ):
-                result += f"- Condenser delta temperature: {diag.condenserDeltaTemperature}K\n"
+            result += _diag_value_lines(diag, _DIAG_REFRIG_FIELDS)
 
         return result
     except Exception as e:
-        return f"Failed to fetch diagnostics: {e}"
+        return _UncachedResult(f"Failed to fetch diagnostics: {e}")
 
 
+@log_function_call
+@_require_vaillant
+@_memoize_result
 def vaillant_get_topology() -> str:
     """Vaillant System Topology - Get the system topology for the Vaillant heat pump/boiler
 
     This function retrieves the system topology, showing all devices connected to the system.
     The topology includes device serial numbers, types, and other identifying information.
     """
-    if VaillantApi is None or _vaillant_import_error is not None:
-        return _VAILLANT_DEPENDENCY_MESSAGE + (
-            f" (import error: {_vaillant_import_error})"
-            if _vaillant_import_error
-            else ""
-        )
-
-    serial = os.getenv("VAILLANT_SERIAL", "UNKNOWN")
-
-    if serial == "UNKNOWN":
-        return "Vaillant heat pump serial number not found."
+    serial = _get_serial()
 
     # use vaillant client to retrieve topology
-    config = VaillantApiConfig()
-    api = VaillantApi(config, [serial])
+    api = _get_api(serial)
 
     try:
-        topology = api.get_topology(serial)
+        with _api_lock:
+            topology = api.get_topology(serial)
 
-        if not topology:
-            return "No topology data available."
+        if topology is None:
+            return _UncachedResult("No topology data available.")
 
         # Format the response to be LLM-friendly
         result = "# Vaillant System Topology\n\n"
@@ -392,7 +596,7 @@ def vaillant_get_topology() -> str:
         # List devices
         result += f"## Devices ({len(topology.devices)})\n\n"
 
-        if not topology.devices:
+        if len(topology.devices) == 0:
             result += "No devices found in the system.\n"
         else:
             # Create table for devices
@@ -401,11 +605,7 @@ def vaillant_get_topology() -> str:
 
             for device in topology.devices:
                 # Mask the serial number for privacy (show only last few characters)
-                masked_serial = (
-                    "V" + device.serialNumber[24:]
-                    if len(device.serialNumber) > 24
-                    else device.serialNumber
-                )
+                masked_serial = _mask_serial(device.serialNumber)
 
                 # Handle optional fields
                 subtype = device.subType or "N/A"
@@ -416,7 +616,10 @@ def vaillant_get_topology() -> str:
                 result += f"| {masked_serial} | {device.type} | {subtype} | {marketing_name} | {nomenclature} | {article_number} |\n"
 
         # Handle unidentified devices if present
-        if topology.unidentifiedDevices:
+        if (
+            topology.unidentifiedDevices is not None
+            and len(topology.unidentifiedDevices) > 0
+        ):
             result += (
                 f"\n## Unidentified Devices ({len(topology.unidentifiedDevices)})\n\n"
             )
@@ -430,36 +633,29 @@ def vaillant_get_topology() -> str:
         return result
 
     except Exception as e:
-        return f"Failed to fetch topology: {e}"
+        return _UncachedResult(f"Failed to fetch topology: {e}")
 
 
+@log_function_call
+@_require_vaillant
+@_memoize_result
 def vaillant_get_settings() -> str:
     """Vaillant System Settings - Get the current settings for the Vaillant heat pump/boiler
 
     This function retrieves the current system settings, including operation modes,
     temperature targets, and schedule information.
     """
-    if VaillantApi is None or _vaillant_import_error is not None:
-        return _VAILLANT_DEPENDENCY_MESSAGE + (
-            f" (import error: {_vaillant_import_error})"
-            if _vaillant_import_error
-            else ""
-        )
-
-    serial = os.getenv("VAILLANT_SERIAL", "UNKNOWN")
-
-    if serial == "UNKNOWN":
-        return "Vaillant heat pump serial number not found."
+    serial = _get_serial()
 
     # use vaillant client to retrieve settings
-    config = VaillantApiConfig()
-    api = VaillantApi(config, [serial])
+    api = _get_api(serial)
 
     try:
-        settings_response = api.get_system_settings(serial, include_metadata=True)
+        with _api_lock:
+            settings_response = api.get_system_settings(serial, include_metadata=True)
 
-        if not settings_response or not settings_response.root:
-            return "No settings data available."
+        if settings_response is None or len(settings_response.root) == 0:
+            return _UncachedResult("No settings data available.")
 
         # Format the response to be LLM-friendly
         result = "# Vaillant System Settings\n\n"
@@ -467,11 +663,7 @@ def vaillant_get_settings() -> str:
         # Process each device's settings
         for settings in settings_response.root:
             # Mask the serial number for privacy
-            masked_serial = (
-                "V" + settings.serialNumber[24:]
-                if len(settings.serialNumber) > 24
-                else settings.serialNumber
-            )
+            masked_serial = _mask_serial(settings.serialNumber)
 
             result += f"## Device: {masked_serial} ({settings.type})\n\n"
 
@@ -511,8 +703,7 @@ def vaillant_get_settings() -> str:
                     result += "\n#### Manual Override\n\n"
                     result += f"- Enabled: {ch.manualOverride.enabled}\n"
                     if ch.manualOverride.until:
-                        override_until = datetime.fromtimestamp(ch.manualOverride.until)
-                        result += f"- Until: {override_until}\n"
+                        result += f"- Until: {_fmt_ts(ch.manualOverride.until)}\n"
                     if ch.manualOverride.roomTemperatureTarget:
                         result += f"- Room temperature target: {ch.manualOverride.roomTemperatureTarget}°C\n"
 
@@ -521,8 +712,7 @@ def vaillant_get_settings() -> str:
                     result += "\n#### Away Override\n\n"
                     result += f"- Enabled: {ch.awayOverride.enabled}\n"
                     if ch.awayOverride.until:
-                        override_until = datetime.fromtimestamp(ch.awayOverride.until)
-                        result += f"- Until: {override_until}\n"
+                        result += f"- Until: {_fmt_ts(ch.awayOverride.until)}\n"
                     if ch.awayOverride.roomTemperatureTarget:
                         result += f"- Room temperature target: {ch.awayOverride.roomTemperatureTarget}°C\n"
 
@@ -539,8 +729,7 @@ def vaillant_get_settings() -> str:
                     result += "\n#### Boost\n\n"
                     result += f"- Enabled: {dhw.boost.enabled}\n"
                     if dhw.boost.until:
-                        boost_until = datetime.fromtimestamp(dhw.boost.until)
-                        result += f"- Until: {boost_until}\n"
+                        result += f"- Until: {_fmt_ts(dhw.boost.until)}\n"
 
             # Temperature corrections
             if settings.temperatureCorrections:
@@ -553,36 +742,29 @@ def vaillant_get_settings() -> str:
         return result
 
     except Exception as e:
-        return f"Failed to fetch settings: {e}"
+        return _UncachedResult(f"Failed to fetch settings: {e}")
 
 
+@log_function_call
+@_require_vaillant
+@_memoize_result
 def vaillant_get_state() -> str:
     """Vaillant System State - Get the current state of the Vaillant heat pump/boiler
 
     This function retrieves the current system state, including operating parameters,
     temperatures, and component status information.
     """
-    if VaillantApi is None or _vaillant_import_error is not None:
-        return _VAILLANT_DEPENDENCY_MESSAGE + (
-            f" (import error: {_vaillant_import_error})"
-            if _vaillant_import_error
-            else ""
-        )
-
-    serial = os.getenv("VAILLANT_SERIAL", "UNKNOWN")
-
-    if serial == "UNKNOWN":
-        return "Vaillant heat pump serial number not found."
+    serial = _get_serial()
 
     # use vaillant client to retrieve state
-    config = VaillantApiConfig()
-    api = VaillantApi(config, [serial])
+    api = _get_api(serial)
 
     try:
-        state_data = api.get_system_state(serial, include_metadata=True)
+        with _api_lock:
+            state_data = api.get_system_state(serial, include_metadata=True)
 
-        if not state_data:
-            return "No state data available."
+        if state_data is None or len(state_data) == 0:
+            return _UncachedResult("No state data available.")
 
         # Format the response to be LLM-friendly
         result = "# Vaillant System State\n\n"
@@ -600,7 +782,7 @@ def vaillant_get_state() -> str:
         return result
 
     except Exception as e:
-        return f"Failed to fetch system state: {e}"
+        return _UncachedResult(f"Failed to fetch system state: {e}")
 
 
 def format_device_state(state_data: dict, index: int) -> str:
@@ -612,90 +794,66 @@ def format_device_state(state_data: dict, index: int) -> str:
     device_type = state_data.get("type", "Unknown")
 
     # Mask the serial number for privacy
-    if isinstance(serial, str) and len(serial) > 24:
-        masked_serial = "V" + serial[24:]
-    else:
-        masked_serial = serial
+    masked_serial = _mask_serial(serial) if isinstance(serial, str) else serial
 
     result += f"## Device: {masked_serial} ({device_type})\n\n"
 
-    # Process common temperature fields
+    # One pass over the state dict, dispatching each value by type instead of
+    # re-scanning the keys for every section
     temperatures = []
-    for key in state_data:
-        if (
-            "temperature" in key.lower()
-            and key != "serialNumber"
-            and isinstance(state_data[key], (int, float))
-        ):
-            temperatures.append((key, state_data[key]))
+    statuses = []
+    nested = []
+    for key, value in state_data.items():
+        if key in ("serialNumber", "_metadata"):
+            continue
+        if isinstance(value, bool):
+            statuses.append((key, value))
+        elif isinstance(value, (int, float)) and "temperature" in key.lower():
+            temperatures.append((key, value))
+        elif isinstance(value, dict):
+            nested.append((key, value))
 
     if temperatures:
         result += "### Temperatures\n\n"
         for name, value in temperatures:
-            # Format key name to make it more readable
-            readable_name = name.replace("Temperature", " Temperature")
-            readable_name = "".join(
-                " " + char if char.isupper() else char for char in readable_name
-            ).strip()
-            readable_name = readable_name.capitalize()
-
-            result += f"- {readable_name}: {value}°C\n"
+            result += f"- {_humanize(name)}: {value}°C\n"
         result += "\n"
 
-    # Process status fields (boolean values)
-    statuses = []
-    for key in state_data:
-        if isinstance(state_data[key], bool) and key != "serialNumber":
-            statuses.append((key, state_data[key]))
-
     if statuses:
         result += "### Status Indicators\n\n"
         for name, value in statuses:
-            # Format key name to make it more readable
-            readable_name = "".join(
-                " " + char if char.isupper() else char for char in name
-            ).strip()
-            readable_name = readable_name.capitalize()
-
             status_text = "Active" if value else "Inactive"
-            result += f"- {readable_name}: {status_text}\n"
+            result += f"- {_humanize(name)}: {status_text}\n"
         result += "\n"
 
     # Process nested objects
-    for key, value in state_data.items():
-        if isinstance(value, dict) and key != "_metadata":
-            result += f"### {key.capitalize()}\n\n"
-            for subkey, subvalue in value.items():
-                if isinstance(subvalue, dict):
-                    # Handle nested dictionaries (one level deep)
-                    result += f"#### {subkey.capitalize()}\n\n"
-                    for subsubkey, subsubvalue in subvalue.items():
-                        readable_name = "".join(
-                            " " + char if char.isupper() else char for char in subsubkey
-                        ).strip()
-                        readable_name = readable_name.capitalize()
-                        result += f"- {readable_name}: {subsubvalue}\n"
+    for key, value in nested:
+        result += f"### {key.capitalize()}\n\n"
+        for subkey, subvalue in value.items():
+            if isinstance(subvalue, dict):
+                # Handle nested dictionaries (one level deep)
+                result += f"#### {subkey.capitalize()}\n\n"
+                for subsubkey, subsubvalue in subvalue.items():
+                    result += f"- {_humanize(subsubkey)}: {subsubvalue}\n"
+            else:
+                # Handle regular key-value pairs
+                readable_name = _humanize(subkey)
+                subkey_lower = subkey.lower()
+
+                # Add units for known fields
+                if "temperature" in subkey_lower and isinstance(
+                    subvalue, (int, float)
+                ):
+                    result += f"- {readable_name}: {subvalue}°C\n"
+                elif "pressure" in subkey_lower and isinstance(
+                    subvalue, (int, float)
+                ):
+                    result += f"- {readable_name}: {subvalue} bar\n"
+                elif isinstance(subvalue, bool):
+                    status_text = "Active" if subvalue else "Inactive"
+                    result += f"- {readable_name}: {status_text}\n"
                 else:
-                    # Handle regular key-value pairs
-                    readable_name = "".join(
-                        " " + char if char.isupper() else char for char in subkey
-                    ).strip()
-                    readable_name = readable_name.capitalize()
-
-                    # Add units for known fields
-                    if "temperature" in subkey.lower() and isinstance(
-                        subvalue, (int, float)
-                    ):
-                        result += f"- {readable_name}: {subvalue}°C\n"
-                    elif "pressure" in subkey.lower() and isinstance(
-                        subvalue, (int, float)
-                    ):
-                        result += f"- {readable_name}: {subvalue} bar\n"
-                    elif isinstance(subvalue, bool):
-                        status_text = "Active" if subvalue else "Inactive"
-                        result += f"- {readable_name}: {status_text}\n"
-                    else:
-                        result += f"- {readable_name}: {subvalue}\n"
-            result += "\n"
+                    result += f"- {readable_name}: {subvalue}\n"
+        result += "\n"
 
     return result
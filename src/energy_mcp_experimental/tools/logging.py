@@ -0,0 +1,97 @@
+"""Shared logging helpers for the MCP tool functions."""
+
+import atexit
+import datetime
+import functools
+import inspect
+import logging
+import logging.handlers
+import os
+import queue
+import time
+
+
+# Configure logging
+def setup_logging():
+    """Set up logging to file and console."""
+    timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M")
+    pid = os.getpid()
+    log_filename = f"energy-mcp-{timestamp}-{pid}.log"
+
+    # Create a logger
+    logger = logging.getLogger("energy_mcp_experimental")
+    logger.setLevel(logging.INFO)
+
+    # Create handlers
+    file_handler = logging.FileHandler(log_filename)
+    file_handler.setLevel(logging.INFO)
+
+    # Create formatters
+    formatter = logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    file_handler.setFormatter(formatter)
+
+    # Queue the records and write them on a background thread so tool calls
+    # never block on disk I/O
+    log_queue: queue.Queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    logger.info(f"Logging initialized. Log file: {log_filename}")
+    return logger
+
+
+@functools.cache
+def _get_logger() -> logging.Logger:
+    """Create the log file lazily so importing the package does no disk I/O."""
+    return setup_logging()
+
+
+# Function decorator for logging
+def log_function_call(func):
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            logger = _get_logger()
+            start_time = time.perf_counter()
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Calling %s with args: %s, kwargs: %s", func.__name__, args, kwargs
+                )
+            try:
+                result = await func(*args, **kwargs)
+                exec_time = time.perf_counter() - start_time
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Function %s completed in %.2fs", func.__name__, exec_time
+                    )
+                return result
+            except Exception as e:
+                logger.error("Error in %s: %s", func.__name__, e, exc_info=True)
+                raise
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        logger = _get_logger()
+        start_time = time.perf_counter()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Calling %s with args: %s, kwargs: %s", func.__name__, args, kwargs
+            )
+        try:
+            result = func(*args, **kwargs)
+            exec_time = time.perf_counter() - start_time
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Function %s completed in %.2fs", func.__name__, exec_time)
+            return result
+        except Exception as e:
+            logger.error("Error in %s: %s", func.__name__, e, exc_info=True)
+            raise
+
+    return wrapper
@@ -1,8 +1,38 @@
-import re
+import functools
 from datetime import datetime
-from typing import Optional
 
+# Bound once so the validators skip the attribute lookup on every call
+_fromisoformat = datetime.fromisoformat
 
+# Strips ASCII whitespace in one C-level pass; cheaper than a regex sub for
+# short postcode strings.
+_WS_TABLE = str.maketrans("", "", " \t\n\r\v\f")
+
+# Outward codes recur constantly (same user, same region), so share one str
+# object per code instead of returning a fresh slice each call.
+_OUTWARD_INTERN: dict[str, str] = {}
+
+
+def _match_outward(code: str) -> bool:
+    r"""Check an uppercased candidate against the outward-code grammar
+    ``[A-Z]{1,2}\d{1,2}[A-Z]?``, consuming the whole string."""
+    n = len(code)
+    i = 0
+    while i < 2 and i < n and "A" <= code[i] <= "Z":
+        i += 1
+    if i == 0:
+        return False
+    digits_start = i
+    while i < n and i - digits_start < 2 and "0" <= code[i] <= "9":
+        i += 1
+    if i == digits_start:
+        return False
+    if i < n and "A" <= code[i] <= "Z":
+        i += 1
+    return i == n
+
+
+@functools.lru_cache(maxsize=4096)
 def validate_and_parse_date(date_str: str) -> datetime | None:
     """Validate the datetime format YYYY-MM-DD or anything that can be parsed by datetime.
 
@@ -14,17 +44,32 @@ def validate_and_parse_date(date_str: str) -> datetime | None:
     """
     if not date_str:
         return None
-    if not isinstance(date_str, str):
-        return None
     if len(date_str) < 8:
         return None
 
+    # Fast path for the dominant YYYY-MM-DD shape: three slice-to-int
+    # conversions skip the general fromisoformat format dispatcher.
+    if (
+        len(date_str) == 10
+        and date_str[4] == "-"
+        and date_str[7] == "-"
+        and date_str.isascii()
+        and date_str[:4].isdigit()
+        and date_str[5:7].isdigit()
+        and date_str[8:].isdigit()
+    ):
+        try:
+            return datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
+        except ValueError:
+            return None
+
     try:
-        return datetime.fromisoformat(date_str)
-    except Exception:
+        return _fromisoformat(date_str)
+    except (ValueError, TypeError):
         return None
 
 
+@functools.lru_cache(maxsize=4096)
 def validate_datetime(datetime_str: str) -> datetime | None:
     """Validate and parse an ISO datetime string.
 
@@ -36,16 +81,31 @@ def validate_datetime(datetime_str: str) -> datetime | None:
     """
     if not datetime_str:
         return None
-    if not isinstance(datetime_str, str):
-        return None
 
     try:
-        # Handle 'Z' UTC designator by replacing with +00:00
-        return datetime.fromisoformat(datetime_str.replace("Z", "+00:00"))
-    except Exception:
+        # fromisoformat accepts the 'Z' UTC designator natively on the
+        # Python versions this package supports (>=3.11)
+        return _fromisoformat(datetime_str)
+    except (ValueError, TypeError):
         return None
 
 
+def validate_datetime_batch(values: list[str]) -> list[datetime | None]:
+    """Validate a list of ISO datetime strings in one pass.
+
+    Convenience wrapper for callers holding a column of timestamps (e.g.
+    hourly readings); each element goes through the cached scalar validator,
+    so repeated stamps cost a dict hit rather than a parse.
+
+    Args:
+        values: The datetime strings to validate and parse
+
+    Returns:
+        A list with a datetime per valid entry and None per invalid one
+    """
+    return [validate_datetime(value) for value in values]
+
+
 def validate_vaillant_serial(serial: str) -> bool:
     """Validate the Vaillant serial number.
 
@@ -55,18 +115,11 @@ def validate_vaillant_serial(serial: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    if not serial:
-        return False
-    if not isinstance(serial, str):
-        return False
-    if len(serial) < 24:
-        return False
-    if not serial.startswith("2"):
-        return False
-    return True
+    return type(serial) is str and len(serial) >= 24 and serial[0] == "2"
 
 
-def validate_and_parse_postcode(postcode: str) -> Optional[str]:
+@functools.lru_cache(maxsize=1024)
+def validate_and_parse_postcode(postcode: str) -> str | None:
     """Validate a UK postcode and extract the outward code.
 
     UK postcodes follow the format: 1-2 letters, followed by 1-2 digits (optional space)
@@ -99,24 +152,39 @@ def validate_and_parse_postcode(postcode: str) -> Optional[str]:
     """
     if not postcode:
         return None
-    if not isinstance(postcode, str):
-        return None
 
     # Remove all spaces and convert to uppercase
-    postcode = re.sub(r"\s+", "", postcode).upper()
-
-    # First check if it's a full postcode
-    # UK postcode regex (simplified version)
-    # Captures the outward code in group 1
-    full_pattern = r"^([A-Z]{1,2}\d{1,2}[A-Z]?)(\d[A-Z]{2})$"
-    match = re.match(full_pattern, postcode)
-    if match:
-        return match.group(1)
-
-    # If not a full postcode, check if it's just an outward code
-    outward_pattern = r"^([A-Z]{1,2}\d{1,2}[A-Z]?)$"
-    match = re.match(outward_pattern, postcode)
-    if match:
-        return match.group(1)
+    postcode = postcode.translate(_WS_TABLE).upper()
+
+    # Cheap pre-filter: outward codes are 2-5 characters, full postcodes 5-7,
+    # and both start with a letter. Rejecting here skips the parser entirely
+    # for obviously invalid input.
+    n = len(postcode)
+    if n < 2 or n > 7 or not postcode[0].isalpha():
+        return None
+
+    # The inward part of a full postcode is always exactly one digit and two
+    # letters, so splitting on length leaves a deterministic outward check
+    # with no regex backtracking to emulate. Five characters is ambiguous:
+    # it can be a short full postcode ("M11AA") or a long bare outward code
+    # ("AA11A"), so when the inward check fails at that length the whole
+    # string is still tried as an outward code.
+    if n >= 5:
+        inward = postcode[-3:]
+        if (
+            "0" <= inward[0] <= "9"
+            and "A" <= inward[1] <= "Z"
+            and "A" <= inward[2] <= "Z"
+        ):
+            outward = postcode[:-3]
+        elif n == 5:
+            outward = postcode
+        else:
+            return None
+    else:
+        outward = postcode
+
+    if _match_outward(outward):
+        return _OUTWARD_INTERN.setdefault(outward, outward)
 
     return None
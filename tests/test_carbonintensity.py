@@ -0,0 +1,88 @@
+"""Tests for the Carbon Intensity API request cache."""
+
+import asyncio
+
+import httpx
+
+from energy_mcp_experimental.servers import carbonintensity
+
+
+def _isolate(monkeypatch, handler):
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), base_url=carbonintensity.BASE_URL
+    )
+    monkeypatch.setattr(carbonintensity, "_CLIENT", client)
+    # Fresh lock so each test's event loop can acquire it
+    monkeypatch.setattr(carbonintensity, "_cache_lock", asyncio.Lock())
+    carbonintensity.clear_cache()
+
+
+def test_recent_responses_are_served_from_cache(monkeypatch):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json={"hit": len(calls)})
+
+    _isolate(monkeypatch, handler)
+
+    async def scenario():
+        first = await carbonintensity._make_request("/generation")
+        second = await carbonintensity._make_request("/generation")
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first == second == {"hit": 1}
+    assert len(calls) == 1
+
+
+def test_expired_entries_are_revalidated_with_etag(monkeypatch):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"data": "fresh"}, headers={"ETag": '"v1"'})
+
+    _isolate(monkeypatch, handler)
+
+    async def scenario():
+        first = await carbonintensity._make_request("/generation")
+
+        # Age the entry past the TTL, keeping the body and ETag around
+        ts, etag, body = carbonintensity._cache["/generation"]
+        carbonintensity._cache["/generation"] = (
+            ts - carbonintensity._CACHE_TTL_SECONDS - 1,
+            etag,
+            body,
+        )
+
+        second = await carbonintensity._make_request("/generation")
+        # The 304 refreshed the TTL, so this is a pure cache hit
+        third = await carbonintensity._make_request("/generation")
+        return first, second, third
+
+    first, second, third = asyncio.run(scenario())
+    assert first == second == third == {"data": "fresh"}
+    assert len(calls) == 2
+    assert calls[1].headers["If-None-Match"] == '"v1"'
+
+
+def test_clear_cache_forces_a_refetch(monkeypatch):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json={"hit": len(calls)})
+
+    _isolate(monkeypatch, handler)
+
+    async def scenario():
+        await carbonintensity._make_request("/generation")
+        carbonintensity.clear_cache()
+        return await carbonintensity._make_request("/generation")
+
+    result = asyncio.run(scenario())
+    assert result == {"hit": 2}
+    assert len(calls) == 2
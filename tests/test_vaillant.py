@@ -0,0 +1,42 @@
+"""Tests for the Vaillant result memoization."""
+
+from energy_mcp_experimental.servers import vaillant
+
+
+def _isolate_disk_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        vaillant, "_DISK_CACHE_PATH", str(tmp_path / "vaillant.json")
+    )
+    monkeypatch.setattr(vaillant, "_disk_cache", None)
+
+
+def test_successful_results_are_cached_and_persisted(monkeypatch, tmp_path):
+    _isolate_disk_cache(monkeypatch, tmp_path)
+    calls = []
+
+    @vaillant._memoize_result
+    def tool(arg):
+        calls.append(arg)
+        return f"report for {arg}"
+
+    assert tool("daily") == "report for daily"
+    assert tool("daily") == "report for daily"
+    assert calls == ["daily"]
+    assert (tmp_path / "vaillant.json").exists()
+
+
+def test_error_results_are_retried_and_never_persisted(monkeypatch, tmp_path):
+    _isolate_disk_cache(monkeypatch, tmp_path)
+    calls = []
+
+    @vaillant._memoize_result
+    def tool(arg):
+        calls.append(arg)
+        return vaillant._UncachedResult(f"Failed to fetch: {arg}")
+
+    assert tool("daily") == "Failed to fetch: daily"
+    assert tool("daily") == "Failed to fetch: daily"
+    # Both calls hit the function: the failure was not served from cache
+    assert calls == ["daily", "daily"]
+    # ... and nothing was written through to disk
+    assert not (tmp_path / "vaillant.json").exists()
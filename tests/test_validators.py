@@ -0,0 +1,91 @@
+"""Tests for the input validators."""
+
+import re
+from datetime import datetime
+from itertools import product
+
+from energy_mcp_experimental.tools.validators import (
+    validate_and_parse_date,
+    validate_and_parse_postcode,
+    validate_datetime,
+    validate_datetime_batch,
+    validate_vaillant_serial,
+)
+
+# The documented postcode grammar, kept as regexes here as the reference
+# oracle for the hand-rolled parser.
+_REF_FULL = re.compile(r"^([A-Z]{1,2}\d{1,2}[A-Z]?)(\d[A-Z]{2})$")
+_REF_OUTWARD = re.compile(r"^([A-Z]{1,2}\d{1,2}[A-Z]?)$")
+
+
+def _reference_parse_postcode(postcode: str) -> str | None:
+    cleaned = re.sub(r"\s+", "", postcode).upper()
+    match = _REF_FULL.match(cleaned) or _REF_OUTWARD.match(cleaned)
+    return match.group(1) if match else None
+
+
+def test_postcode_accepted_corpus():
+    cases = {
+        "SW1A 1AA": "SW1A",
+        "SW1A1AA": "SW1A",
+        "M1 1AA": "M1",
+        "M11AA": "M1",
+        "sw1a 1aa": "SW1A",
+        "EC1A 1BB": "EC1A",
+        "A111AA": "A11",
+        "SW1A": "SW1A",  # outward code only
+        "M1": "M1",  # outward code only
+        "AA11A": "AA11A",  # five-character outward code
+    }
+    for raw, outward in cases.items():
+        assert validate_and_parse_postcode(raw) == outward, raw
+
+
+def test_postcode_rejected_corpus():
+    rejected = ["", "123", "1A1AA", "ABC1", "A1B2", "SW1A 1A1", "SW1A 1AAA", "!!"]
+    for raw in rejected:
+        assert validate_and_parse_postcode(raw) is None, raw
+
+
+def test_postcode_matches_reference_grammar():
+    # Exhaustively compare the parser against the documented regexes over a
+    # small alphabet that exercises every state: letters, digits, whitespace.
+    for length in range(1, 7):
+        for chars in product("AZ19 ", repeat=length):
+            raw = "".join(chars)
+            assert validate_and_parse_postcode(raw) == _reference_parse_postcode(
+                raw
+            ), raw
+
+
+def test_validate_and_parse_date():
+    assert validate_and_parse_date("2025-01-31") == datetime(2025, 1, 31)
+    assert validate_and_parse_date("2025-01-31T10:30") == datetime(2025, 1, 31, 10, 30)
+    assert validate_and_parse_date("20250131") == datetime(2025, 1, 31)
+    assert validate_and_parse_date("2025-02-30") is None
+    assert validate_and_parse_date("2025-1-1") is None
+    assert validate_and_parse_date("not-a-date") is None
+    assert validate_and_parse_date("") is None
+
+
+def test_validate_datetime():
+    parsed = validate_datetime("2025-05-01T01:00Z")
+    assert parsed is not None
+    assert parsed.tzinfo is not None
+    assert validate_datetime("2025-05-01T01:00+00:00") == parsed
+    assert validate_datetime("not-a-datetime") is None
+    assert validate_datetime("") is None
+
+
+def test_validate_datetime_batch():
+    valid, invalid = validate_datetime_batch(["2025-05-01T01:00Z", "junk"])
+    assert valid == validate_datetime("2025-05-01T01:00Z")
+    assert invalid is None
+
+
+def test_validate_vaillant_serial():
+    assert validate_vaillant_serial("2" + "1" * 23) is True
+    assert validate_vaillant_serial("2" + "1" * 22) is False  # too short
+    assert validate_vaillant_serial("1" + "1" * 23) is False  # wrong prefix
+    assert validate_vaillant_serial("") is False
+    assert validate_vaillant_serial(None) is False